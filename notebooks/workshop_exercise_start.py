@@ -48,6 +48,9 @@
     "import matplotlib.pyplot as plt\n",
     "import seaborn as sns\n",
     "\n",
+    "# The dataset is in the 'data' folder one level up from this notebook\n",
+    "data_path = '../data/jordan_ecommerce_sample.csv'\n",
+    "\n",
     "# Set visualization style\n",
     "sns.set_style('whitegrid')\n",
     "plt.rcParams['figure.figsize'] = (10, 6)\n",
@@ -55,6 +58,172 @@
     "print(\"✅ Libraries imported successfully!\")"
    ]
   },
+  {
+   "cell_type": "markdown",
+   "metadata": {},
+   "source": [
+    "### ⚡ Optional: Fast Preview for Big Files\n",
+    "\n",
+    "On a small file like ours, `pd.read_csv` takes a blink. On a multi-GB export you can wait minutes just to see column stats!\n",
+    "\n",
+    "Instead, we can **sample** the file while reading it:\n",
+    "- Jump to random spots in the file and read a small block of rows from each spot\n",
+    "- **Stratify** the rows by city and month, keeping at most a fixed number of rows per group\n",
+    "- Estimate each column's mean with a **95% confidence interval** from the sample\n",
+    "\n",
+    "The preview stops as soon as its time budget runs out, then the full file keeps loading in the background. Part 1 reuses that load instead of reading the file a second time."
+   ]
+  },
+  {
+   "cell_type": "code",
+   "execution_count": null,
+   "metadata": {},
+   "outputs": [],
+   "source": [
+    "import io\n",
+    "import os\n",
+    "import time\n",
+    "from concurrent.futures import ThreadPoolExecutor\n",
+    "\n",
+    "def preview_sample(path, n_blocks=200, block_bytes=64_000, per_group=200, time_budget=0.5, seed=42):\n",
+    "    \"\"\"Read blocks of rows from random spots in the file, keeping at most `per_group` rows per (city, month).\"\"\"\n",
+    "    rng = np.random.default_rng(seed)\n",
+    "    size = os.path.getsize(path)\n",
+    "    blocks = []\n",
+    "    start = time.perf_counter()\n",
+    "\n",
+    "    with open(path, 'rb') as f:\n",
+    "        header = f.readline()\n",
+    "        covered_end = len(header)  # Everything before this byte has already been read\n",
+    "        offsets = np.sort(rng.integers(len(header), max(size, len(header) + 1), n_blocks))\n",
+    "        offsets[0] = len(header)  # Always read the first block right after the header\n",
+    "        for offset in offsets:\n",
+    "            if time.perf_counter() - start > time_budget:\n",
+    "                break\n",
+    "            if offset > covered_end:\n",
+    "                f.seek(offset)\n",
+    "                f.readline()  # Skip the partial row we landed in\n",
+    "            else:\n",
+    "                f.seek(covered_end)\n",
+    "            block_start = f.tell()\n",
+    "            block = f.read(block_bytes)\n",
+    "            block = block[:block.rfind(b'\\n') + 1]  # Drop the partial row at the end\n",
+    "            if not block:\n",
+    "                continue\n",
+    "            covered_end = block_start + len(block)\n",
+    "            blocks.append(pd.read_csv(io.BytesIO(header + block)))\n",
+    "\n",
+    "    if blocks:\n",
+    "        sample = pd.concat(blocks, ignore_index=True)\n",
+    "    else:\n",
+    "        sample = pd.read_csv(io.BytesIO(header))  # Nothing to read - empty preview with the right columns\n",
+    "    sample['month'] = pd.to_datetime(sample['order_date'], errors='coerce').dt.to_period('M')\n",
+    "\n",
+    "    # How many rows of each (city, month) group we saw, before capping\n",
+    "    group_sizes = sample.groupby(['city', 'month'], dropna=False).size()\n",
+    "\n",
+    "    # Shuffle, then keep the first `per_group` rows of every group\n",
+    "    sample = sample.sample(frac=1, random_state=seed)\n",
+    "    sample = sample[sample.groupby(['city', 'month'], dropna=False).cumcount() < per_group]\n",
+    "\n",
+    "    elapsed = time.perf_counter() - start\n",
+    "    print(f\"⚡ Sampled {len(sample)} rows from {len(blocks)} blocks in {elapsed:.2f} seconds\")\n",
+    "    return sample, group_sizes\n",
+    "\n",
+    "\n",
+    "def weighted_median(values, weights):\n",
+    "    \"\"\"Median where each value counts as much as its weight.\"\"\"\n",
+    "    order = np.argsort(values)\n",
+    "    values, weights = values[order], weights[order]\n",
+    "    cumulative = np.cumsum(weights)\n",
+    "    return values[np.searchsorted(cumulative, cumulative[-1] / 2)]\n",
+    "\n",
+    "\n",
+    "def describe_with_ci(sample, group_sizes, confidence_z=1.96):\n",
+    "    \"\"\"Describe-style summary of the numeric columns, with a confidence interval for each mean.\"\"\"\n",
+    "    groups = sample.groupby(['city', 'month'], dropna=False)\n",
+    "\n",
+    "    summary = {}\n",
+    "    for column in sample.select_dtypes('number').columns:\n",
+    "        stats = groups[column].agg(['mean', 'var', 'count'])\n",
+    "\n",
+    "        # Each group's share of the rows we saw, using only groups that have values for this column\n",
+    "        stats = stats[stats['count'] > 0]\n",
+    "        if stats.empty:\n",
+    "            continue\n",
+    "        w = group_sizes.reindex(stats.index)\n",
+    "        w = w / w.sum()\n",
+    "\n",
+    "        # Single-row groups have no variance of their own, so borrow the whole sample's\n",
+    "        var = stats['var'].fillna(sample[column].var())\n",
+    "\n",
+    "        # Stratified estimate: weight each group's mean by its share of the rows\n",
+    "        mean = (w * stats['mean']).sum()\n",
+    "        std_error = np.sqrt((w**2 * var / stats['count']).sum())\n",
+    "\n",
+    "        # Capping oversamples small groups, so weight every row by (group share / rows kept)\n",
+    "        rows = sample.dropna(subset=[column])\n",
+    "        keys = pd.MultiIndex.from_arrays([rows['city'], rows['month']])\n",
+    "        row_weights = (w / stats['count']).reindex(keys).to_numpy()\n",
+    "        values = rows[column].to_numpy(dtype='float64')\n",
+    "\n",
+    "        summary[column] = {\n",
+    "            'count': len(values),\n",
+    "            'mean': mean,\n",
+    "            'ci_low': mean - confidence_z * std_error,\n",
+    "            'ci_high': mean + confidence_z * std_error,\n",
+    "            'std': np.sqrt(np.sum(row_weights * (values - mean)**2)),\n",
+    "            '50%': weighted_median(values, row_weights),\n",
+    "            # The sample can only show the smallest/largest values it happened to read\n",
+    "            'sample_min': values.min(),\n",
+    "            'sample_max': values.max(),\n",
+    "        }\n",
+    "    return pd.DataFrame(summary)"
+   ]
+  },
+  {
+   "cell_type": "code",
+   "execution_count": null,
+   "metadata": {},
+   "outputs": [],
+   "source": [
+    "# Preview the file in well under a second\n",
+    "preview, group_sizes = preview_sample(data_path)\n",
+    "\n",
+    "print(\"Preview Summary (95% confidence intervals for the mean):\")\n",
+    "print(\"=\"*80)\n",
+    "describe_with_ci(preview, group_sizes)"
+   ]
+  },
+  {
+   "cell_type": "code",
+   "execution_count": null,
+   "metadata": {},
+   "outputs": [],
+   "source": [
+    "# Meanwhile, load the full file in the background\n",
+    "executor = ThreadPoolExecutor(max_workers=1)\n",
+    "full_load = executor.submit(pd.read_csv, data_path)\n",
+    "\n",
+    "print(\"⏳ Full file is loading in the background...\")\n",
+    "print(\"Run the next cell whenever you want the exact summary.\")"
+   ]
+  },
+  {
+   "cell_type": "code",
+   "execution_count": null,
+   "metadata": {},
+   "outputs": [],
+   "source": [
+    "# Check on the full load - this waits for it if it isn't finished yet\n",
+    "if not full_load.done():\n",
+    "    print(\"⏳ Still loading - waiting for the full pass to finish...\")\n",
+    "\n",
+    "print(\"Exact Statistical Summary (full file):\")\n",
+    "print(\"=\"*80)\n",
+    "full_load.result().describe()"
+   ]
+  },
   {
    "cell_type": "code",
    "execution_count": null,
@@ -62,8 +231,11 @@
    "outputs": [],
    "source": [
     "# Load the dataset\n",
-    "# The file is located in the 'data' folder one level up from this notebook\n",
-    "df = pd.read_csv('../data/jordan_ecommerce_sample.csv')\n",
+    "# If the fast preview above already started loading the file, reuse that load\n",
+    "if 'full_load' in globals():\n",
+    "    df = full_load.result()\n",
+    "else:\n",
+    "    df = pd.read_csv(data_path)\n",
     "\n",
     "print(\"✅ Data loaded successfully!\")\n",
     "print(f\"\\nDataset shape: {df.shape[0]} rows, {df.shape[1]} columns\")"
@@ -641,6 +813,349 @@
     "print(\"\\n\" + \"=\"*80)"
    ]
   },
+  {
+   "cell_type": "markdown",
+   "metadata": {},
+   "source": [
+    "---\n",
+    "## Part 10: Reports for Every City & Month\n",
+    "\n",
+    "Managers usually want the same report for **each city** and **each month**, not just one global report.\n",
+    "\n",
+    "The naive way is to filter `df` once per report (like `amman_data` in Challenge 1) and re-run every step. With 7 cities and 3 months, that means 10 filtered copies and 10 full runs!\n",
+    "\n",
+    "Instead, we'll plan all the reports together:\n",
+    "1. **Share the grouped passes.** We turn the text columns into `category` columns once, so grouping works on fast integer codes. Then one set of grouped passes per key (city or month) computes the metrics for *every* city or month at the same time.\n",
+    "2. **Pick out each report's results.** Each report just looks up its own rows.\n",
+    "3. **Render the charts and summaries in parallel.** Each report is saved to the `reports` folder."
+   ]
+  },
+  {
+   "cell_type": "code",
+   "execution_count": null,
+   "metadata": {},
+   "outputs": [],
+   "source": [
+    "import os\n",
+    "import time\n",
+    "from concurrent.futures import ThreadPoolExecutor\n",
+    "from matplotlib.figure import Figure\n",
+    "\n",
+    "# Columns we can break a partition down by\n",
+    "BREAKDOWNS = ['city', 'product_category', 'payment_method', 'month']\n",
+    "\n",
+    "# Columns we can make one report per value of (render_report draws city and month reports)\n",
+    "PARTITION_KEYS = ['city', 'month']\n",
+    "\n",
+    "def compute_partition_metrics(data, key):\n",
+    "    \"\"\"Compute the Part 3-9 metrics for every value of `key` in a few grouped passes.\"\"\"\n",
+    "    orders = data.groupby(key, observed=True)['total_amount'].agg(['sum', 'count', 'mean', 'median'])\n",
+    "\n",
+    "    # One grouped pass per breakdown, shared by every partition\n",
+    "    breakdowns = {}\n",
+    "    for column in BREAKDOWNS:\n",
+    "        if column != key:\n",
+    "            breakdowns[column] = data.groupby([key, column], observed=True)['total_amount'].agg(['sum', 'count'])\n",
+    "\n",
+    "    metrics = {}\n",
+    "    for value, row in orders.iterrows():\n",
+    "        result = {\n",
+    "            'total_revenue': row['sum'],\n",
+    "            'total_orders': int(row['count']),\n",
+    "            'average_order': row['mean'],\n",
+    "            'median_order': row['median'],\n",
+    "        }\n",
+    "        if 'city' in breakdowns:\n",
+    "            result['revenue_by_city'] = breakdowns['city'].loc[value, 'sum'].sort_values(ascending=False)\n",
+    "        if 'product_category' in breakdowns:\n",
+    "            by_product = breakdowns['product_category'].loc[value]\n",
+    "            result['revenue_by_product'] = by_product['sum'].sort_values(ascending=False)\n",
+    "            result['top_products'] = by_product['count'].sort_values(ascending=False)\n",
+    "        if 'payment_method' in breakdowns:\n",
+    "            result['payment_counts'] = breakdowns['payment_method'].loc[value, 'count'].sort_values(ascending=False)\n",
+    "        if 'month' in breakdowns:\n",
+    "            monthly = breakdowns['month'].loc[value, 'sum'].sort_index()\n",
+    "            result['monthly_sales'] = monthly\n",
+    "            # Growth needs at least two months and a non-zero starting month\n",
+    "            if len(monthly) >= 2 and monthly.iloc[0] != 0:\n",
+    "                result['growth_rate'] = (monthly.iloc[-1] - monthly.iloc[0]) / monthly.iloc[0] * 100\n",
+    "        metrics[value] = result\n",
+    "    return metrics\n",
+    "\n",
+    "\n",
+    "def plan_reports(data, report_specs):\n",
+    "    \"\"\"Compute the metrics for all report specs, sharing one set of passes per partition key.\"\"\"\n",
+    "    # Category columns are grouped by their integer codes, so each pass skips re-hashing the strings\n",
+    "    data = data[BREAKDOWNS + ['total_amount']].astype({column: 'category' for column in BREAKDOWNS})\n",
+    "\n",
+    "    names = set()\n",
+    "    for spec in report_specs:\n",
+    "        if spec['name'] in names:\n",
+    "            raise ValueError(f\"More than one report is named '{spec['name']}'\")\n",
+    "        names.add(spec['name'])\n",
+    "        if spec['partition'] not in PARTITION_KEYS:\n",
+    "            raise ValueError(f\"Report '{spec['name']}' has partition '{spec['partition']}', expected one of {PARTITION_KEYS}\")\n",
+    "        if spec['value'] not in data[spec['partition']].cat.categories:\n",
+    "            raise ValueError(f\"Report '{spec['name']}' asks for {spec['partition']} '{spec['value']}', which is not in the data\")\n",
+    "\n",
+    "    results = {}\n",
+    "    for key in {spec['partition'] for spec in report_specs}:\n",
+    "        partition_metrics = compute_partition_metrics(data, key)\n",
+    "        for spec in report_specs:\n",
+    "            if spec['partition'] == key:\n",
+    "                results[spec['name']] = partition_metrics[spec['value']]\n",
+    "    return results"
+   ]
+  },
+  {
+   "cell_type": "code",
+   "execution_count": null,
+   "metadata": {},
+   "outputs": [],
+   "source": [
+    "def render_report(name, metrics, output_dir='../reports'):\n",
+    "    \"\"\"Save one report's chart (PNG) and summary (TXT) to `output_dir`.\"\"\"\n",
+    "    # Figure() instead of plt.figure(), so reports can be drawn safely in parallel\n",
+    "    fig = Figure(figsize=(16, 6))\n",
+    "    axes = fig.subplots(1, 2)\n",
+    "\n",
+    "    metrics['revenue_by_product'].sort_values().plot(kind='barh', ax=axes[0], color='lightcoral', edgecolor='black')\n",
+    "    axes[0].set_title('Revenue by Product Category (JOD)', fontsize=14, fontweight='bold')\n",
+    "    axes[0].grid(axis='x', alpha=0.3)\n",
+    "\n",
+    "    # City reports show the monthly trend, month reports show the cities\n",
+    "    if 'monthly_sales' in metrics:\n",
+    "        metrics['monthly_sales'].plot(kind='line', ax=axes[1], marker='o', color='green', linewidth=3, markersize=10)\n",
+    "        axes[1].set_title('Monthly Sales Trend', fontsize=14, fontweight='bold')\n",
+    "    else:\n",
+    "        metrics['revenue_by_city'].plot(kind='bar', ax=axes[1], color='steelblue', edgecolor='black')\n",
+    "        axes[1].set_title('Revenue by City (JOD)', fontsize=14, fontweight='bold')\n",
+    "    axes[1].grid(True, alpha=0.3)\n",
+    "\n",
+    "    fig.suptitle(f'Sales Report: {name}', fontsize=16, fontweight='bold')\n",
+    "    fig.tight_layout()\n",
+    "    fig.savefig(os.path.join(output_dir, f'{name}.png'))\n",
+    "\n",
+    "    lines = [\n",
+    "        f\"SALES REPORT: {name}\",\n",
+    "        \"=\" * 50,\n",
+    "        f\"Total revenue: {metrics['total_revenue']:,.0f} JOD\",\n",
+    "        f\"Total transactions: {metrics['total_orders']}\",\n",
+    "        f\"Average order value: {metrics['average_order']:.2f} JOD\",\n",
+    "        f\"Median order value: {metrics['median_order']:.2f} JOD\",\n",
+    "        f\"Most ordered category: {metrics['top_products'].index[0]} ({metrics['top_products'].iloc[0]} orders)\",\n",
+    "        f\"Highest revenue category: {metrics['revenue_by_product'].index[0]} ({metrics['revenue_by_product'].iloc[0]:,.0f} JOD)\",\n",
+    "        f\"Most popular payment method: {metrics['payment_counts'].index[0]} ({metrics['payment_counts'].iloc[0]} orders)\",\n",
+    "    ]\n",
+    "    if 'growth_rate' in metrics:\n",
+    "        lines.append(f\"Sales growth (first → last month): {metrics['growth_rate']:.1f}%\")\n",
+    "    with open(os.path.join(output_dir, f'{name}.txt'), 'w', encoding='utf-8') as f:\n",
+    "        f.write('\\n'.join(lines) + '\\n')\n",
+    "    return name"
+   ]
+  },
+  {
+   "cell_type": "code",
+   "execution_count": null,
+   "metadata": {},
+   "outputs": [],
+   "source": [
+    "# Use month labels like '2024-08' instead of Period objects\n",
+    "report_data = df.assign(month=df['month'].astype(str))\n",
+    "\n",
+    "# One report spec per city and per month\n",
+    "report_specs = (\n",
+    "    [{'name': city, 'partition': 'city', 'value': city} for city in report_data['city'].dropna().unique()]\n",
+    "    + [{'name': month, 'partition': 'month', 'value': month} for month in report_data['month'].unique()]\n",
+    ")\n",
+    "\n",
+    "# Step 1: Compute every report's metrics together\n",
+    "start = time.perf_counter()\n",
+    "report_results = plan_reports(report_data, report_specs)\n",
+    "\n",
+    "# Step 2: Render all reports in parallel\n",
+    "os.makedirs('../reports', exist_ok=True)\n",
+    "with ThreadPoolExecutor() as pool:\n",
+    "    rendered = list(pool.map(render_report, report_results.keys(), report_results.values()))\n",
+    "\n",
+    "print(f\"✅ Generated {len(rendered)} reports in {time.perf_counter() - start:.2f} seconds\")\n",
+    "print(\"Reports saved to the 'reports' folder:\")\n",
+    "print(rendered)"
+   ]
+  },
+  {
+   "cell_type": "markdown",
+   "metadata": {},
+   "source": [
+    "---\n",
+    "## Part 11: Saving Insights & Comparing Runs\n",
+    "\n",
+    "The Part 9 summary is just printed text. To compare this week's insights with last week's, we'd have to re-run both analyses on the raw orders!\n",
+    "\n",
+    "Instead, we'll save the computed results as a small **snapshot** file:\n",
+    "- Each snapshot is a compressed NumPy `.npz` file, one entry per metric\n",
+    "- A tiny `__index__` entry records the format version, the save time, the metric names, and all single-number metrics\n",
+    "- Loading is **lazy**: only the index and the metrics you actually compare are read from disk\n",
+    "\n",
+    "Comparing two snapshots then takes milliseconds, so we can keep months of history and get alerts when something changes."
+   ]
+  },
+  {
+   "cell_type": "code",
+   "execution_count": null,
+   "metadata": {},
+   "outputs": [],
+   "source": [
+    "import json\n",
+    "import os\n",
+    "import time\n",
+    "\n",
+    "SNAPSHOT_VERSION = 1\n",
+    "\n",
+    "def save_snapshot(path, metrics):\n",
+    "    \"\"\"Save a dict of metrics (numbers or Series) as a compressed snapshot file. Returns the file's path.\"\"\"\n",
+    "    # np.savez_compressed adds '.npz' to paths without it, so add it ourselves and return the real path\n",
+    "    if not path.endswith('.npz'):\n",
+    "        path += '.npz'\n",
+    "\n",
+    "    index = {'version': SNAPSHOT_VERSION, 'created': pd.Timestamp.now().isoformat(), 'scalars': {}, 'series': []}\n",
+    "    arrays = {}\n",
+    "    for name, value in metrics.items():\n",
+    "        if isinstance(value, pd.Series):\n",
+    "            arrays[f'{name}__keys'] = value.index.astype(str).to_numpy(dtype=str)\n",
+    "            arrays[f'{name}__values'] = value.to_numpy(dtype='float64')\n",
+    "            index['series'].append(name)\n",
+    "        else:\n",
+    "            index['scalars'][name] = float(value)\n",
+    "    arrays['__index__'] = np.frombuffer(json.dumps(index).encode('utf-8'), dtype=np.uint8)\n",
+    "\n",
+    "    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)\n",
+    "    np.savez_compressed(path, **arrays)\n",
+    "    return path\n",
+    "\n",
+    "\n",
+    "def load_snapshot(path):\n",
+    "    \"\"\"Open a snapshot lazily. Returns (index, file); metrics are only read when accessed.\"\"\"\n",
+    "    snapshot = np.load(path, allow_pickle=False)\n",
+    "    try:\n",
+    "        index = json.loads(snapshot['__index__'].tobytes().decode('utf-8'))\n",
+    "        if index['version'] > SNAPSHOT_VERSION:\n",
+    "            raise ValueError(f\"{path} uses snapshot version {index['version']}, but we can only read up to {SNAPSHOT_VERSION}\")\n",
+    "    except Exception:\n",
+    "        snapshot.close()\n",
+    "        raise\n",
+    "    return index, snapshot\n",
+    "\n",
+    "\n",
+    "def read_series(snapshot, name):\n",
+    "    \"\"\"Read one Series metric from an open snapshot.\"\"\"\n",
+    "    return pd.Series(snapshot[f'{name}__values'], index=snapshot[f'{name}__keys'], name=name)\n",
+    "\n",
+    "\n",
+    "def compare_values(rows, name, key, old, new, in_old, in_new):\n",
+    "    \"\"\"Add one diff row if the value differs, marking values that appeared, disappeared, or became/stopped being NaN.\"\"\"\n",
+    "    if not in_old:\n",
+    "        status = 'added'\n",
+    "    elif not in_new:\n",
+    "        status = 'removed'\n",
+    "    elif old == new or (np.isnan(old) and np.isnan(new)):\n",
+    "        return  # Unchanged - NaN in both snapshots counts as the same\n",
+    "    elif np.isnan(old):\n",
+    "        status = 'now_present'\n",
+    "    elif np.isnan(new):\n",
+    "        status = 'now_missing'\n",
+    "    else:\n",
+    "        status = 'changed'\n",
+    "    rows.append((name, key, status, old, new))\n",
+    "\n",
+    "\n",
+    "def diff_snapshots(old_path, new_path, metrics=None):\n",
+    "    \"\"\"Compare two snapshots and return one row per value that changed, appeared or disappeared.\"\"\"\n",
+    "    rows = []\n",
+    "    old_index, old_snapshot = load_snapshot(old_path)\n",
+    "    with old_snapshot:\n",
+    "        new_index, new_snapshot = load_snapshot(new_path)\n",
+    "        with new_snapshot:\n",
+    "            # Single numbers come straight from the index - no metric arrays are read\n",
+    "            old_scalars, new_scalars = old_index['scalars'], new_index['scalars']\n",
+    "            for name in old_scalars.keys() | new_scalars.keys():\n",
+    "                if metrics is None or name in metrics:\n",
+    "                    compare_values(rows, name, '', old_scalars.get(name, np.nan), new_scalars.get(name, np.nan),\n",
+    "                                   name in old_scalars, name in new_scalars)\n",
+    "\n",
+    "            # Series are only read from the snapshots that have them\n",
+    "            old_series, new_series = set(old_index['series']), set(new_index['series'])\n",
+    "            for name in old_series | new_series:\n",
+    "                if metrics is None or name in metrics:\n",
+    "                    old_values = read_series(old_snapshot, name) if name in old_series else pd.Series(dtype='float64')\n",
+    "                    new_values = read_series(new_snapshot, name) if name in new_series else pd.Series(dtype='float64')\n",
+    "                    for key in old_values.index.union(new_values.index):\n",
+    "                        compare_values(rows, name, key, old_values.get(key, np.nan), new_values.get(key, np.nan),\n",
+    "                                       key in old_values.index, key in new_values.index)\n",
+    "\n",
+    "    diff = pd.DataFrame(rows, columns=['metric', 'key', 'status', 'old', 'new'])\n",
+    "    diff['change'] = diff['new'] - diff['old']\n",
+    "    # Percent change only makes sense for numbers in both snapshots with a non-zero old value\n",
+    "    has_base = (diff['status'] == 'changed') & (diff['old'] != 0)\n",
+    "    diff['pct_change'] = (diff['change'] / diff['old'].abs() * 100).where(has_base)\n",
+    "    return diff.sort_values(['metric', 'key']).reset_index(drop=True)"
+   ]
+  },
+  {
+   "cell_type": "code",
+   "execution_count": null,
+   "metadata": {},
+   "outputs": [],
+   "source": [
+    "# Save this run's Part 9 insights, named by today's date\n",
+    "insights = {\n",
+    "    'revenue_by_city': revenue_by_city,\n",
+    "    'revenue_by_product': revenue_by_product,\n",
+    "    'monthly_sales': monthly_sales,\n",
+    "    'payment_counts': payment_counts,\n",
+    "    'growth_rate': growth_rate,\n",
+    "    'average_order': average_order,\n",
+    "    'median_order': median_order,\n",
+    "}\n",
+    "snapshot_path = save_snapshot(f\"../snapshots/insights_{pd.Timestamp.now():%Y-%m-%d}.npz\", insights)\n",
+    "\n",
+    "print(f\"✅ Snapshot saved: {snapshot_path} ({os.path.getsize(snapshot_path):,} bytes)\")\n",
+    "\n",
+    "# Compare with the previous snapshot, if we have one\n",
+    "history = sorted(f for f in os.listdir('../snapshots') if f.startswith('insights_'))\n",
+    "if len(history) > 1:\n",
+    "    start = time.perf_counter()\n",
+    "    changes = diff_snapshots(os.path.join('../snapshots', history[-2]), snapshot_path)\n",
+    "    print(f\"Changes since {history[-2]} (compared in {(time.perf_counter() - start) * 1000:.1f} ms):\")\n",
+    "    print(changes)\n",
+    "else:\n",
+    "    print(\"This is the first snapshot - run again next week to compare!\")"
+   ]
+  },
+  {
+   "cell_type": "code",
+   "execution_count": null,
+   "metadata": {},
+   "outputs": [],
+   "source": [
+    "# Try it now: save each month's report from Part 10 and compare September with October\n",
+    "for month in ['2024-09', '2024-10']:\n",
+    "    save_snapshot(f'../snapshots/report_{month}.npz', report_results[month])\n",
+    "\n",
+    "start = time.perf_counter()\n",
+    "changes = diff_snapshots('../snapshots/report_2024-09.npz', '../snapshots/report_2024-10.npz')\n",
+    "print(f\"Compared two snapshots in {(time.perf_counter() - start) * 1000:.1f} ms\")\n",
+    "\n",
+    "# Alert on any metric that moved by more than 10%, appeared, disappeared, became NaN, or changed from zero\n",
+    "big_move = changes['pct_change'].abs() > 10\n",
+    "new_or_gone = changes['status'] != 'changed'  # added, removed, now_present, now_missing\n",
+    "from_zero = (changes['status'] == 'changed') & (changes['old'] == 0)\n",
+    "alerts = changes[big_move | new_or_gone | from_zero]\n",
+    "print(f\"\\n🚨 {len(alerts)} metrics need attention (September → October):\")\n",
+    "print(\"=\"*80)\n",
+    "alerts"
+   ]
+  },
   {
    "cell_type": "markdown",
    "metadata": {},